@@ -0,0 +1,154 @@
+"""
+This module provides numba-compiled traversal kernels that operate on the
+CSR arrays of a FrozenDigraph. All kernels work on integer node ids and
+return arrays of ids; mapping back to nodes is left to the caller.
+Visited sets are bitsets packed into uint64 words, one bit per node.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _new_bitset(num_nodes):
+    """Returns a zeroed bitset with one bit per node, packed into uint64 words."""
+    return np.zeros((num_nodes + 63) >> 6, np.uint64)
+
+
+@njit(cache=True)
+def _is_set(bits, node):
+    """Returns True if the bit for node is set."""
+    return (bits[node >> 6] >> np.uint64(node & 63)) & np.uint64(1) != 0
+
+
+@njit(cache=True)
+def _set(bits, node):
+    """Sets the bit for node."""
+    bits[node >> 6] |= np.uint64(1) << np.uint64(node & 63)
+
+
+@njit(cache=True)
+def bfs_csr(row_ptr, col_idx, start):
+    """
+    Performs a BFS from start, returning the visited node ids in order
+    (excluding the start node).
+    """
+    num_nodes = row_ptr.size - 1
+    visited = _new_bitset(num_nodes)
+    queue = np.empty(num_nodes, np.int32)
+    head = 0
+    tail = 0
+    queue[tail] = start
+    tail += 1
+    _set(visited, start)
+
+    while head < tail:
+        node = queue[head]
+        head += 1
+        for k in range(row_ptr[node], row_ptr[node + 1]):
+            neighbor = col_idx[k]
+            if not _is_set(visited, neighbor):
+                _set(visited, neighbor)
+                queue[tail] = neighbor
+                tail += 1
+    return queue[1:tail]
+
+
+@njit(cache=True)
+def dfs_csr(row_ptr, col_idx, start):
+    """
+    Performs a DFS from start, returning the visited node ids in order
+    (excluding the start node). Neighbors are visited in ascending id order.
+    """
+    num_nodes = row_ptr.size - 1
+    visited = _new_bitset(num_nodes)
+    stack = np.empty(col_idx.size + 1, np.int32)
+    out = np.empty(num_nodes, np.int32)
+    top = 0
+    count = 0
+    _set(visited, start)
+    for k in range(row_ptr[start + 1] - 1, row_ptr[start] - 1, -1):
+        stack[top] = col_idx[k]
+        top += 1
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        if not _is_set(visited, node):
+            _set(visited, node)
+            out[count] = node
+            count += 1
+            for k in range(row_ptr[node + 1] - 1, row_ptr[node] - 1, -1):
+                neighbor = col_idx[k]
+                if not _is_set(visited, neighbor):
+                    stack[top] = neighbor
+                    top += 1
+    return out[:count]
+
+
+@njit(cache=True)
+def _heap_push(heap, size, value):
+    """Pushes value onto the min-heap stored in heap[:size]."""
+    pos = size
+    heap[pos] = value
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if heap[parent] <= value:
+            break
+        heap[pos] = heap[parent]
+        pos = parent
+    heap[pos] = value
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap, size):
+    """Removes the smallest value from the min-heap stored in heap[:size]."""
+    smallest = heap[0]
+    size -= 1
+    last = heap[size]
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if last <= heap[child]:
+            break
+        heap[pos] = heap[child]
+        pos = child
+    if size > 0:
+        heap[pos] = last
+    return smallest, size
+
+
+@njit(cache=True)
+def topsort_csr_kahn(row_ptr, col_idx):
+    """
+    Performs a topological sort using Kahn's algorithm, returning node ids
+    and taking the smallest available id first. If the graph has a cycle
+    the result is shorter than the number of nodes.
+    """
+    num_nodes = row_ptr.size - 1
+    indeg = np.zeros(num_nodes, np.int32)
+    for k in range(col_idx.size):
+        indeg[col_idx[k]] += 1
+
+    heap = np.empty(num_nodes, np.int32)
+    size = 0
+    for node in range(num_nodes):
+        if indeg[node] == 0:
+            size = _heap_push(heap, size, node)
+
+    out = np.empty(num_nodes, np.int32)
+    count = 0
+    while size > 0:
+        node, size = _heap_pop(heap, size)
+        out[count] = node
+        count += 1
+        for k in range(row_ptr[node], row_ptr[node + 1]):
+            neighbor = col_idx[k]
+            indeg[neighbor] -= 1
+            if indeg[neighbor] == 0:
+                size = _heap_push(heap, size, neighbor)
+    return out[:count]
@@ -2,24 +2,45 @@
 This module provides classes for creating and traversing directed graphs,
 including a specialized Directed Acyclic Graph (DAG) that prevents cycles.
 """
+import sys
 from collections import deque
+from importlib import import_module
+from functools import cache
+from heapq import heapify, heappush, heappop
 
 # --- Base Classes (Final Version) ---
 
+def _intern(node):
+    """
+    Returns node interned if it is a string, so adjacency lookups can match
+    keys by identity instead of comparing characters.
+    """
+    if isinstance(node, str):
+        try:
+            return sys.intern(node)
+        except TypeError:
+            # str subclasses cannot be interned.
+            return node
+    return node
+
 class Digraph:
     """
-    A simple implementation of a directed graph using an adjacency list.
+    A simple implementation of a directed graph using adjacency sets.
     """
     def __init__(self):
         """Initializes a new, empty Digraph."""
         self.adj = {}
+        self.radj = {}
         self.nodes = {}
         self.edges = {}
+        self._sorted_cache = {}
 
     def add_node(self, node, attrs=None):
         """Adds a node to the graph if it does not already exist."""
+        node = _intern(node)
         if node not in self.adj:
-            self.adj[node] = []
+            self.adj[node] = set()
+            self.radj[node] = set()
             self.nodes[node] = attrs
 
     def get_nodes(self):
@@ -34,10 +55,19 @@ class Digraph:
         """
         Adds a directed edge from start_node to end_node and stores its attributes.
         """
-        self.add_node(start_node)
-        self.add_node(end_node)
-        if end_node not in self.adj[start_node]:
-            self.adj[start_node].append(end_node)
+        start_node = _intern(start_node)
+        end_node = _intern(end_node)
+        adj = self.adj
+        radj = self.radj
+        successors = adj.setdefault(start_node, set())
+        adj.setdefault(end_node, set())
+        radj.setdefault(start_node, set())
+        self.nodes.setdefault(start_node, None)
+        self.nodes.setdefault(end_node, None)
+        if end_node not in successors:
+            successors.add(end_node)
+            radj.setdefault(end_node, set()).add(start_node)
+            self._sorted_cache.pop(start_node, None)
         self.edges[(start_node, end_node)] = kwargs
 
     def get_edge_weight(self, start_node, end_node):
@@ -45,17 +75,32 @@ class Digraph:
         edge_attrs = self.edges.get((start_node, end_node), {})
         return edge_attrs.get('edge_weight')
 
+    def _sorted_neighbors(self, node):
+        """Returns a cached, sorted tuple of the successors of a node."""
+        cached = self._sorted_cache.get(node)
+        if cached is None:
+            cached = tuple(sorted(self.adj[node]))
+            self._sorted_cache[node] = cached
+        return cached
+
     def successors(self, node):
         """Returns a sorted list of successors for a given node."""
         if node not in self.adj:
             raise KeyError(f"Node {node} not in graph.")
-        return sorted(self.adj[node])
+        return list(self._sorted_neighbors(node))
 
     def predecessors(self, node):
         """Returns a sorted list of predecessors for a given node."""
         if node not in self.adj:
             raise KeyError(f"Node {node} not in graph.")
-        return sorted([u for u, neighbors in self.adj.items() if node in neighbors])
+        return sorted(self.radj[node])
+
+    def freeze(self):
+        """
+        Returns a read-only FrozenDigraph snapshot of this graph stored
+        in compressed sparse row (CSR) form. Requires numpy.
+        """
+        return FrozenDigraph(self)
 
     def __repr__(self):
         return f"Digraph({self.adj})"
@@ -65,21 +110,65 @@ class SortableDigraph(Digraph):
     Inherits from Digraph and adds topological sorting functionality.
     """
     def top_sort(self):
-        """Performs a topological sort of the graph's nodes."""
+        """
+        Performs a topological sort of the graph's nodes using Kahn's algorithm.
+        Ties are broken by taking the smallest available node first.
+        Raises a ValueError if the graph contains a cycle.
+        """
+        indeg = {node: len(preds) for node, preds in self.radj.items()}
+
+        heap = [node for node, degree in indeg.items() if degree == 0]
+        heapify(heap)
+        sorted_order = []
+
+        while heap:
+            node = heappop(heap)
+            sorted_order.append(node)
+            for neighbor in self.adj[node]:
+                indeg[neighbor] -= 1
+                if indeg[neighbor] == 0:
+                    heappush(heap, neighbor)
+
+        if len(sorted_order) != len(self.adj):
+            raise ValueError("Graph contains a cycle; no topological order exists.")
+        return sorted_order
+
+    def dfs_top_sort(self):
+        """
+        Performs a topological sort by reversing an iterative DFS postorder,
+        visiting roots and neighbors in sorted order.
+        Raises a ValueError if the graph contains a cycle.
+        """
         visited = set()
+        on_stack = set()
         sorted_order = []
 
-        def visit(node):
-            """Recursive helper function for topological sort."""
-            if node not in visited:
-                visited.add(node)
-                for neighbor in sorted(self.adj.get(node, [])):
-                    visit(neighbor)
-                sorted_order.insert(0, node)
+        for root in sorted(self.adj):
+            if root in visited:
+                continue
+            visited.add(root)
+            on_stack.add(root)
+            stack = [(root, iter(self._sorted_neighbors(root)))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor in on_stack:
+                        raise ValueError(
+                            "Graph contains a cycle; no topological order exists."
+                        )
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        on_stack.add(neighbor)
+                        stack.append(
+                            (neighbor, iter(self._sorted_neighbors(neighbor)))
+                        )
+                        break
+                else:
+                    sorted_order.append(node)
+                    on_stack.discard(node)
+                    stack.pop()
 
-        for node in sorted(list(self.adj.keys())):
-            if node not in visited:
-                visit(node)
+        sorted_order.reverse()
         return sorted_order
 
 # --- Classes for the Assignment (Final Version) ---
@@ -97,7 +186,7 @@ class TraversableDigraph(SortableDigraph):
             raise KeyError(f"Node {start_node} not in graph.")
 
         visited = {start_node}
-        stack = list(sorted(self.adj[start_node], reverse=True))
+        stack = list(reversed(self._sorted_neighbors(start_node)))
         path = []
 
         while stack:
@@ -105,7 +194,7 @@ class TraversableDigraph(SortableDigraph):
             if node not in visited:
                 visited.add(node)
                 path.append(node)
-                for neighbor in sorted(self.adj[node], reverse=True):
+                for neighbor in reversed(self._sorted_neighbors(node)):
                     if neighbor not in visited:
                         stack.append(neighbor)
         return path
@@ -119,18 +208,41 @@ class TraversableDigraph(SortableDigraph):
             raise KeyError(f"Node {start_node} not in graph.")
 
         visited = {start_node}
-        queue = deque(sorted(self.adj[start_node]))
-
-        for node in queue:
-            visited.add(node)
+        queue = deque([start_node])
 
         while queue:
             node = queue.popleft()
-            yield node
-            for neighbor in sorted(self.adj[node]):
+            for neighbor in self._sorted_neighbors(node):
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue.append(neighbor)
+                    yield neighbor
+
+    def _dfs_unordered(self, start_node):
+        """
+        Yields the nodes reachable from start_node (excluding it) in no
+        particular order. Used where only membership matters.
+        """
+        visited = {start_node}
+        stack = [start_node]
+        while stack:
+            node = stack.pop()
+            for neighbor in self.adj[node]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+                    yield neighbor
+
+    def _reaches(self, src, dst):
+        """
+        Returns True if dst is reachable from src, stopping as soon as
+        dst is found.
+        """
+        if src == dst:
+            return True
+        if src not in self.adj:
+            return False
+        return any(node == dst for node in self._dfs_unordered(src))
 
 class DAG(TraversableDigraph):
     """
@@ -142,13 +254,255 @@ class DAG(TraversableDigraph):
         Adds an edge, but first checks if doing so would create a cycle.
         Raises a ValueError if a cycle is detected.
         """
-        self.add_node(start_node)
-        self.add_node(end_node)
-
         # A cycle is created if a path already exists from end_node to start_node.
-        if start_node == end_node or start_node in self.dfs(end_node):
+        if self._reaches(end_node, start_node):
             raise ValueError(
                 f"Adding edge from {start_node} to {end_node} creates a cycle."
             )
 
         super().add_edge(start_node, end_node, **kwargs)
+
+    def add_edges_from(self, edges):
+        """
+        Adds every (start_node, end_node) pair in edges, then checks for
+        cycles once with a topological sort. If the batch creates a cycle
+        a ValueError is raised; on any error the graph is restored.
+        """
+        adj = {node: set(neighbors) for node, neighbors in self.adj.items()}
+        radj = {node: set(neighbors) for node, neighbors in self.radj.items()}
+        nodes = dict(self.nodes)
+        edge_attrs = dict(self.edges)
+
+        committed = False
+        try:
+            for start_node, end_node in edges:
+                super().add_edge(start_node, end_node)
+            try:
+                self.top_sort()
+            except ValueError as exc:
+                raise ValueError("Adding these edges creates a cycle.") from exc
+            committed = True
+        finally:
+            if not committed:
+                self.adj, self.radj = adj, radj
+                self.nodes, self.edges = nodes, edge_attrs
+                self._sorted_cache.clear()
+
+# --- Frozen (CSR) Representation ---
+
+@cache
+def _load_numpy():
+    """
+    Returns the numpy module, or None if numpy is not installed.
+    Imported on first use so graphs that are never frozen don't load numpy.
+    """
+    try:
+        return import_module("numpy")
+    except ImportError:
+        return None
+
+@cache
+def _load_kernels():
+    """
+    Returns the numba kernels module, or None if numba is not installed.
+    Imported on first use so graphs that are never frozen don't load numba.
+    """
+    try:
+        return import_module("_kernels")
+    except ImportError:
+        return None
+
+def _weight_arrays(np, weights):
+    """
+    Packs edge weights into a value array and a boolean mask marking which
+    edges have a weight. Values are float64 if every weight is a float,
+    otherwise an object array that keeps each weight unchanged.
+    """
+    present = np.array([weight is not None for weight in weights], dtype=bool)
+    if all(weight is None or isinstance(weight, float) for weight in weights):
+        values = np.array(
+            [0.0 if weight is None else weight for weight in weights],
+            dtype=np.float64,
+        )
+    else:
+        values = np.empty(len(weights), dtype=object)
+        for slot, weight in enumerate(weights):
+            values[slot] = weight
+    return values, present
+
+class FrozenDigraph:  # pylint: disable=too-many-instance-attributes
+    """
+    A read-only snapshot of a Digraph stored as CSR arrays. Nodes are
+    remapped to dense integer ids in sorted order (insertion order if the
+    nodes cannot be compared), and the neighbors of node id i are
+    col_idx[row_ptr[i]:row_ptr[i + 1]], sorted by id.
+    Edge weights live in an array parallel to col_idx, float64 when every
+    weight is a float and object otherwise, with weight_present marking
+    which edges have one.
+    Traversals use the numba kernels in _kernels when numba is installed.
+    """
+    def __init__(self, graph):
+        """Builds the CSR arrays from the adjacency sets of graph."""
+        np = _load_numpy()
+        if np is None:
+            raise ImportError("FrozenDigraph requires numpy.")
+        self._np = np
+        self._source_type = type(graph)
+        self._kernels = _load_kernels()
+        try:
+            self.id_to_node = sorted(graph.adj)
+        except TypeError:
+            self.id_to_node = list(graph.adj)
+        self.node_to_id = {node: i for i, node in enumerate(self.id_to_node)}
+        self.nodes = {node: graph.nodes.get(node) for node in self.id_to_node}
+        self.edges = {edge: dict(attrs) for edge, attrs in graph.edges.items()}
+
+        num_nodes = len(self.id_to_node)
+        self.row_ptr = np.empty(num_nodes + 1, dtype=np.int32)
+        self.row_ptr[0] = 0
+        self.row_ptr[1:] = np.cumsum(
+            [len(graph.adj[node]) for node in self.id_to_node]
+        )
+        self.col_idx = np.empty(self.row_ptr[-1], dtype=np.int32)
+        weights = []
+        for i, node in enumerate(self.id_to_node):
+            neighbors = sorted(graph.adj[node], key=self.node_to_id.__getitem__)
+            self.col_idx[self.row_ptr[i]:self.row_ptr[i + 1]] = [
+                self.node_to_id[neighbor] for neighbor in neighbors
+            ]
+            weights.extend(
+                graph.get_edge_weight(node, neighbor) for neighbor in neighbors
+            )
+        self.weights, self.weight_present = _weight_arrays(np, weights)
+
+    def _id(self, node):
+        """Returns the integer id of a node, raising KeyError if absent."""
+        if node not in self.node_to_id:
+            raise KeyError(f"Node {node} not in graph.")
+        return self.node_to_id[node]
+
+    def _neighbor_ids(self, node_id):
+        """Returns the contiguous slice of successor ids for a node id."""
+        return self.col_idx[self.row_ptr[node_id]:self.row_ptr[node_id + 1]]
+
+    def _to_nodes(self, ids):
+        """Maps an array of node ids back to a list of nodes."""
+        return [self.id_to_node[i] for i in ids.tolist()]
+
+    def get_nodes(self):
+        """Returns a list of all nodes in the graph."""
+        return list(self.id_to_node)
+
+    def get_edge_weight(self, start_node, end_node):
+        """Returns the 'edge_weight' of an edge, or None if it has none."""
+        if start_node not in self.node_to_id or end_node not in self.node_to_id:
+            return None
+        start = self.node_to_id[start_node]
+        end = self.node_to_id[end_node]
+        row_start = self.row_ptr[start]
+        slot = row_start + self._np.searchsorted(self._neighbor_ids(start), end)
+        if slot == self.row_ptr[start + 1] or self.col_idx[slot] != end:
+            return None
+        if not self.weight_present[slot]:
+            return None
+        weight = self.weights[slot]
+        return weight if self.weights.dtype == object else float(weight)
+
+    def successors(self, node):
+        """Returns a sorted list of successors for a given node."""
+        return [self.id_to_node[i] for i in self._neighbor_ids(self._id(node))]
+
+    def dfs(self, start_node):
+        """
+        Performs a DFS, returning an ordered list of visited nodes
+        (excluding the start node).
+        """
+        start = self._id(start_node)
+        if self._kernels is not None:
+            return self._to_nodes(
+                self._kernels.dfs_csr(self.row_ptr, self.col_idx, start)
+            )
+
+        visited = {start}
+        stack = list(reversed(self._neighbor_ids(start).tolist()))
+        path = []
+
+        while stack:
+            node = stack.pop()
+            if node not in visited:
+                visited.add(node)
+                path.append(self.id_to_node[node])
+                for neighbor in reversed(self._neighbor_ids(node).tolist()):
+                    if neighbor not in visited:
+                        stack.append(neighbor)
+        return path
+
+    def bfs(self, start_node):
+        """
+        Performs a BFS, yielding traversed nodes one by one
+        (excluding the start node).
+        """
+        start = self._id(start_node)
+        if self._kernels is not None:
+            yield from self._to_nodes(
+                self._kernels.bfs_csr(self.row_ptr, self.col_idx, start)
+            )
+            return
+
+        visited = {start}
+        queue = deque([start])
+
+        while queue:
+            node = queue.popleft()
+            for neighbor in self._neighbor_ids(node).tolist():
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+                    yield self.id_to_node[neighbor]
+
+    def top_sort(self):
+        """
+        Performs a topological sort using Kahn's algorithm, breaking ties
+        by taking the smallest available node first.
+        Raises a ValueError if the graph contains a cycle.
+        """
+        if self._kernels is not None:
+            sorted_order = self._to_nodes(
+                self._kernels.topsort_csr_kahn(self.row_ptr, self.col_idx)
+            )
+        else:
+            sorted_order = self._top_sort_python()
+
+        if len(sorted_order) != len(self.id_to_node):
+            raise ValueError("Graph contains a cycle; no topological order exists.")
+        return sorted_order
+
+    def _top_sort_python(self):
+        """Pure-Python Kahn's algorithm over the CSR arrays."""
+        indeg = self._np.bincount(
+            self.col_idx, minlength=len(self.id_to_node)
+        ).tolist()
+        heap = [node for node, degree in enumerate(indeg) if degree == 0]
+        heapify(heap)
+        sorted_order = []
+
+        while heap:
+            node = heappop(heap)
+            sorted_order.append(self.id_to_node[node])
+            for neighbor in self._neighbor_ids(node).tolist():
+                indeg[neighbor] -= 1
+                if indeg[neighbor] == 0:
+                    heappush(heap, neighbor)
+        return sorted_order
+
+    def unfreeze(self):
+        """
+        Returns a mutable graph of the original type with the same nodes,
+        node values and edges, for when edges need to be edited.
+        """
+        graph = self._source_type()
+        for node, attrs in self.nodes.items():
+            graph.add_node(node, attrs)
+        for (start_node, end_node), attrs in self.edges.items():
+            graph.add_edge(start_node, end_node, **attrs)
+        return graph
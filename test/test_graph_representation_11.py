@@ -0,0 +1,21 @@
+import pytest
+
+from student_code import SortableDigraph
+
+def test_top_sort_cycle_raises():
+    graph = SortableDigraph()
+    graph.add_edge("a", "b")
+    graph.add_edge("b", "a")
+    graph.add_edge("c", "a")
+
+    # Kahn's algorithm cannot order nodes on or after a cycle, so the
+    # sort must fail instead of returning a truncated order.
+    with pytest.raises(ValueError):
+        graph.top_sort()
+
+def test_top_sort_acyclic():
+    graph = SortableDigraph()
+    graph.add_edge("c", "a")
+    graph.add_edge("a", "b")
+    graph.add_node("d")
+    assert graph.top_sort() == ["c", "a", "b", "d"]
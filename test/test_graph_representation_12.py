@@ -0,0 +1,43 @@
+import pytest
+
+from student_code import DAG
+
+def make_graph():
+    graph = DAG()
+    graph.add_node("x", 1)
+    graph.add_edge("x", "y", edge_weight=5, color="r")
+    return graph
+
+def assert_unchanged(graph):
+    assert graph.adj == {"x": {"y"}, "y": set()}
+    assert graph.radj == {"x": set(), "y": {"x"}}
+    assert graph.nodes == {"x": 1, "y": None}
+    assert list(graph.edges) == [("x", "y")]
+    assert graph.edges[("x", "y")]["color"] == "r"
+    assert graph.get_edge_weight("x", "y") == 5
+    assert graph.successors("x") == ["y"]
+
+def test_add_edges_from():
+    graph = make_graph()
+    graph.add_edges_from([("y", "z"), ("x", "z")])
+    assert graph.successors("x") == ["y", "z"]
+    assert graph.predecessors("z") == ["x", "y"]
+    assert graph.top_sort() == ["x", "y", "z"]
+
+def test_add_edges_from_cycle_rolls_back():
+    graph = make_graph()
+    # Re-adding x -> y would clear its attributes, so the rollback must
+    # restore them along with the new edges.
+    with pytest.raises(ValueError):
+        graph.add_edges_from([("x", "y"), ("y", "z"), ("z", "x")])
+    assert_unchanged(graph)
+
+def test_add_edges_from_malformed_rolls_back():
+    graph = make_graph()
+    with pytest.raises(ValueError):
+        graph.add_edges_from([("y", "z"), ("z",)])
+    assert_unchanged(graph)
+
+    with pytest.raises(TypeError):
+        graph.add_edges_from([("y", "z"), (["unhashable"], "z")])
+    assert_unchanged(graph)
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from student_code import DAG, TraversableDigraph
+
+def random_dag(seed):
+    rng = random.Random(seed)
+    graph = DAG()
+    num_nodes = rng.randint(1, 25)
+    for node in range(num_nodes):
+        graph.add_node(node, node * 10)
+    for _ in range(rng.randint(0, 60)):
+        start_node, end_node = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        if start_node < end_node:
+            graph.add_edge(start_node, end_node, edge_weight=start_node + end_node)
+    return graph
+
+def test_frozen_matches_mutable():
+    for seed in range(50):
+        graph = random_dag(seed)
+        frozen = graph.freeze()
+        assert frozen.get_nodes() == sorted(graph.get_nodes())
+        assert frozen.top_sort() == graph.top_sort()
+        for node in graph.get_nodes():
+            assert frozen.successors(node) == graph.successors(node)
+            assert frozen.dfs(node) == graph.dfs(node)
+            assert list(frozen.bfs(node)) == list(graph.bfs(node))
+
+def test_frozen_string_nodes():
+    graph = TraversableDigraph()
+    graph.add_edge("A", "B")
+    graph.add_edge("A", "C")
+    graph.add_edge("B", "D")
+    graph.add_edge("C", "D")
+    graph.add_edge("D", "E")
+    frozen = graph.freeze()
+    assert frozen.dfs("A") == ["B", "D", "E", "C"]
+    assert list(frozen.bfs("A")) == ["B", "C", "D", "E"]
+    assert frozen.top_sort() == ["A", "B", "C", "D", "E"]
+    with pytest.raises(KeyError):
+        frozen.dfs("Z")
+
+def test_unfreeze_round_trip():
+    graph = random_dag(7)
+    thawed = graph.freeze().unfreeze()
+    assert type(thawed) is DAG
+    assert thawed.adj == graph.adj
+    assert thawed.radj == graph.radj
+    assert thawed.nodes == graph.nodes
+    assert thawed.edges.keys() == graph.edges.keys()
+    # The thawed graph is mutable again and still rejects cycles.
+    thawed.add_edge("new", 0)
+    with pytest.raises(ValueError):
+        thawed.add_edge(0, "new")
+
+def test_freeze_empty_graph():
+    frozen = DAG().freeze()
+    assert frozen.get_nodes() == []
+    assert frozen.top_sort() == []
+    assert frozen.get_edge_weight("a", "b") is None
+    assert DAG().freeze().unfreeze().adj == {}
+
+def test_freeze_unorderable_nodes():
+    graph = TraversableDigraph()
+    graph.add_edge(1, "a")
+    graph.add_edge(2, 3)
+    graph.add_edge("a", 3)
+    frozen = graph.freeze()
+    # Nodes that cannot be sorted keep their insertion order as ids.
+    assert frozen.get_nodes() == [1, "a", 2, 3]
+    assert frozen.dfs(1) == ["a", 3]
+    assert list(frozen.bfs(2)) == [3]
+    assert frozen.top_sort() == [1, "a", 2, 3]
+    assert frozen.successors("a") == [3]
+    assert frozen.unfreeze().adj == graph.adj
+
+def test_freeze_copies_edge_attributes():
+    graph = DAG()
+    graph.add_edge("a", "b", edge_weight=1, color="r")
+    frozen = graph.freeze()
+    graph.edges[("a", "b")]["color"] = "g"
+    graph.edges[("a", "b")]["edge_weight"] = 9
+    assert frozen.edges[("a", "b")] == {"edge_weight": 1, "color": "r"}
+    assert frozen.unfreeze().edges[("a", "b")] == {"edge_weight": 1, "color": "r"}
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+pytest.importorskip("numba")
+
+from student_code import DAG, TraversableDigraph
+
+def random_graph(seed, acyclic):
+    rng = random.Random(seed)
+    graph = DAG() if acyclic else TraversableDigraph()
+    num_nodes = rng.randint(1, 40)
+    for node in range(num_nodes):
+        graph.add_node(node)
+    for _ in range(rng.randint(0, 120)):
+        start_node, end_node = rng.randrange(num_nodes), rng.randrange(num_nodes)
+        if not acyclic or start_node < end_node:
+            graph.add_edge(start_node, end_node)
+    return graph
+
+def frozen_pair(graph):
+    compiled = graph.freeze()
+    python = graph.freeze()
+    python._kernels = None
+    assert compiled._kernels is not None
+    return compiled, python
+
+def test_kernels_match_python_traversals():
+    for seed in range(50):
+        # Cyclic graphs and self-loops exercise the visited bitsets.
+        compiled, python = frozen_pair(random_graph(seed, acyclic=False))
+        for node in compiled.get_nodes():
+            assert compiled.dfs(node) == python.dfs(node)
+            assert list(compiled.bfs(node)) == list(python.bfs(node))
+
+def test_kernel_top_sort_matches_python():
+    for seed in range(50):
+        graph = random_graph(seed, acyclic=True)
+        compiled, python = frozen_pair(graph)
+        assert compiled.top_sort() == python.top_sort() == graph.top_sort()
+
+def test_kernel_top_sort_cycle_raises():
+    graph = TraversableDigraph()
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 0)
+    compiled, python = frozen_pair(graph)
+    with pytest.raises(ValueError):
+        compiled.top_sort()
+    with pytest.raises(ValueError):
+        python.top_sort()
+
+def test_kernels_on_wide_graph():
+    # More than 64 nodes so the bitset spans several uint64 words.
+    graph = TraversableDigraph()
+    for node in range(1, 200):
+        graph.add_edge(0, node)
+        graph.add_edge(node, (node * 7) % 200)
+    compiled, python = frozen_pair(graph)
+    assert compiled.dfs(0) == python.dfs(0)
+    assert list(compiled.bfs(0)) == list(python.bfs(0))
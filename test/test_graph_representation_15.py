@@ -0,0 +1,80 @@
+import pytest
+
+from student_code import DAG
+
+def make_graph():
+    graph = DAG()
+    graph.add_edge("a", "b", edge_weight=5, color="r")
+    graph.add_edge("b", "c", edge_weight=2.5)
+    graph.add_edge("a", "c")
+    return graph
+
+def test_edge_weight_attributes():
+    graph = make_graph()
+    assert graph.get_edge_weight("a", "b") == 5
+    assert graph.get_edge_weight("a", "c") is None
+    assert graph.get_edge_weight("c", "a") is None
+    assert graph.edges[("a", "b")] == {"edge_weight": 5, "color": "r"}
+
+    # The edges dict is the only store, so edits to it are seen directly.
+    graph.edges[("a", "b")]["edge_weight"] = 9
+    assert graph.get_edge_weight("a", "b") == 9
+
+    # Re-adding an edge replaces its attributes, including the weight.
+    graph.add_edge("a", "b", color="g")
+    assert graph.get_edge_weight("a", "b") is None
+    assert graph.edges[("a", "b")] == {"color": "g"}
+
+def test_edge_weight_after_freeze():
+    pytest.importorskip("numpy")
+    frozen = make_graph().freeze()
+    assert frozen.get_edge_weight("a", "b") == 5
+    assert frozen.get_edge_weight("b", "c") == 2.5
+    assert frozen.get_edge_weight("a", "c") is None
+    assert frozen.get_edge_weight("c", "a") is None
+    assert frozen.get_edge_weight("a", "missing") is None
+
+    thawed = frozen.unfreeze()
+    assert thawed.get_edge_weight("a", "b") == 5
+    assert thawed.get_edge_weight("b", "c") == 2.5
+    assert thawed.get_edge_weight("a", "c") is None
+    assert thawed.edges == make_graph().edges
+
+def test_non_numeric_edge_weight_after_freeze():
+    pytest.importorskip("numpy")
+    graph = make_graph()
+    graph.add_edge("c", "d", edge_weight="heavy")
+    frozen = graph.freeze()
+    assert frozen.get_edge_weight("c", "d") == "heavy"
+    assert frozen.get_edge_weight("a", "b") == 5
+    assert frozen.get_edge_weight("a", "c") is None
+    assert frozen.unfreeze().get_edge_weight("c", "d") == "heavy"
+
+def test_frozen_edge_weights_keep_their_values():
+    pytest.importorskip("numpy")
+    graph = DAG()
+    graph.add_edge("a", "b", edge_weight=3)
+    graph.add_edge("a", "c", edge_weight=2**60 + 1)
+    graph.add_edge("b", "c", edge_weight=float("nan"))
+    graph.add_edge("c", "d", edge_weight=0.1)
+    frozen = graph.freeze()
+
+    weight = frozen.get_edge_weight("a", "b")
+    assert weight == 3 and isinstance(weight, int)
+    assert frozen.get_edge_weight("a", "c") == 2**60 + 1
+    nan_weight = frozen.get_edge_weight("b", "c")
+    assert nan_weight is not None and nan_weight != nan_weight
+    assert frozen.get_edge_weight("c", "d") == 0.1
+
+def test_frozen_float_weights_use_float_array():
+    np = pytest.importorskip("numpy")
+    graph = DAG()
+    graph.add_edge("a", "b", edge_weight=1.5)
+    graph.add_edge("b", "c", edge_weight=float("nan"))
+    graph.add_edge("a", "c")
+    frozen = graph.freeze()
+    assert frozen.weights.dtype == np.float64
+    assert frozen.get_edge_weight("a", "b") == 1.5
+    nan_weight = frozen.get_edge_weight("b", "c")
+    assert nan_weight != nan_weight
+    assert frozen.get_edge_weight("a", "c") is None
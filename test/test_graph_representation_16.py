@@ -0,0 +1,63 @@
+import random
+import sys
+
+import pytest
+
+from student_code import DAG, SortableDigraph
+
+def recursive_top_sort(graph):
+    # The original recursive implementation, kept as the reference order.
+    visited = set()
+    sorted_order = []
+
+    def visit(node):
+        if node not in visited:
+            visited.add(node)
+            for neighbor in sorted(graph.adj[node]):
+                visit(neighbor)
+            sorted_order.insert(0, node)
+
+    for node in sorted(graph.adj):
+        visit(node)
+    return sorted_order
+
+def test_dfs_top_sort_matches_recursive_order():
+    rng = random.Random(0)
+    for _ in range(100):
+        graph = DAG()
+        num_nodes = rng.randint(1, 25)
+        for node in range(num_nodes):
+            graph.add_node(node)
+        for _ in range(rng.randint(0, 60)):
+            start_node, end_node = rng.randrange(num_nodes), rng.randrange(num_nodes)
+            if start_node < end_node:
+                graph.add_edge(start_node, end_node)
+        assert graph.dfs_top_sort() == recursive_top_sort(graph)
+
+def test_dfs_top_sort_long_chain():
+    # Longer than the recursion limit, which the recursive version hits.
+    length = sys.getrecursionlimit() * 5
+    graph = DAG()
+    graph.add_edges_from((node, node + 1) for node in range(length))
+    assert graph.dfs_top_sort() == list(range(length + 1))
+
+def test_dfs_top_sort_cycle_raises():
+    graph = SortableDigraph()
+    graph.add_edge("a", "b")
+    graph.add_edge("b", "a")
+    with pytest.raises(ValueError):
+        graph.dfs_top_sort()
+
+    graph = SortableDigraph()
+    graph.add_edge("a", "a")
+    with pytest.raises(ValueError):
+        graph.dfs_top_sort()
+
+    # A cycle reached only through an earlier, finished root.
+    graph = SortableDigraph()
+    graph.add_edge("a", "c")
+    graph.add_edge("b", "c")
+    graph.add_edge("c", "d")
+    graph.add_edge("d", "c")
+    with pytest.raises(ValueError):
+        graph.dfs_top_sort()
@@ -0,0 +1,22 @@
+import pytest
+
+from student_code import TraversableDigraph
+
+def make_graph():
+    graph = TraversableDigraph()
+    graph.add_edge(0, 0)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 1)
+    return graph
+
+def test_bfs_self_loop_excludes_start():
+    # The start node is never yielded, even when it has a self-loop.
+    graph = make_graph()
+    assert list(graph.bfs(0)) == [1]
+    assert list(graph.bfs(1)) == []
+
+def test_frozen_bfs_self_loop_excludes_start():
+    pytest.importorskip("numpy")
+    frozen = make_graph().freeze()
+    assert list(frozen.bfs(0)) == [1]
+    assert list(frozen.bfs(1)) == []